@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import logging
+import os
 import shutil
 import subprocess
 import sys
@@ -13,10 +15,19 @@ from logging.handlers import RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 PROJECT_ROOT = Path(__file__).parent
 SRC_DIR = PROJECT_ROOT / "src"
 PACKAGE_NAME = "NetshTool"
 ENTRY_SCRIPT = PROJECT_ROOT / "run.py"
+# PyInstaller 工作目录：保留在 build/ 之外，跨构建复用 Analysis 缓存
+PYINSTALLER_WORK_DIR = PROJECT_ROOT / ".pyinstaller_cache"
+# 版本资源等构建中间文件：必须在 workpath 之外，--clean 会清空 workpath
+BUILD_TEMP_DIR = PROJECT_ROOT / ".build_temp"
 
 
 def _get_logs_dir() -> Path:
@@ -58,29 +69,67 @@ def _run(
 ) -> None:
     display = " ".join(args)
     logging.info(f"执行命令: {display}")
-    subprocess.run(
-        args,
-        cwd=str(cwd) if cwd is not None else None,
-        env=env,
-        check=True,
-    )
+
+    # 非交互环境（CI 等）下把子进程输出重定向到日志文件，
+    # 避免 PyInstaller 的大量输出逐行经过终端
+    if sys.stderr.isatty():
+        subprocess.run(
+            args,
+            cwd=str(cwd) if cwd is not None else None,
+            env=env,
+            check=True,
+        )
+        return
+
+    logs_dir = _get_logs_dir()
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    command_log = logs_dir / f"build_{date.today():%Y%m%d}.log"
+    with open(command_log, "ab") as log_file:
+        subprocess.run(
+            args,
+            cwd=str(cwd) if cwd is not None else None,
+            env=env,
+            check=True,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+        )
+    logging.info(f"命令输出已写入: {command_log}")
+
+
+# 同一次构建内 version_info.json 会被读取多次，缓存解析结果
+_version_info_cache: dict[str, Any] | None = None
 
 
 def _load_version_info() -> dict[str, Any]:
+    global _version_info_cache
+    if _version_info_cache is not None:
+        return _version_info_cache
+
     version_info_path = PROJECT_ROOT / "version_info.json"
-    data = json.loads(version_info_path.read_text(encoding="utf-8"))
+    if orjson is not None:
+        data = orjson.loads(version_info_path.read_bytes())
+    else:
+        data = json.loads(version_info_path.read_text(encoding="utf-8"))
     if not isinstance(data, dict):
         raise ValueError("version_info.json 内容格式错误")
     if "version" not in data:
         raise ValueError("version_info.json 缺少 version 字段")
+    _version_info_cache = data
     return data
 
 
 def _write_version_info(data: dict[str, Any]) -> None:
+    global _version_info_cache
     version_info_path = PROJECT_ROOT / "version_info.json"
-    version_info_path.write_text(
-        json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
-    )
+    if orjson is not None:
+        version_info_path.write_bytes(
+            orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n"
+        )
+    else:
+        version_info_path.write_text(
+            json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+        )
+    _version_info_cache = data
 
 
 def _parse_semver(version: str) -> tuple[int, int, int]:
@@ -137,7 +186,17 @@ VSVersionInfo(
 )
 """.lstrip()
 
+    # 内容未变化时不重写文件，保持 mtime 稳定，
+    # 让 PyInstaller 跳过重复的资源嵌入步骤
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+    digest_path = output_path.with_suffix(output_path.suffix + ".sha")
+    if output_path.exists() and digest_path.exists():
+        if digest_path.read_text(encoding="utf-8") == digest:
+            return
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
     output_path.write_text(content, encoding="utf-8")
+    digest_path.write_text(digest, encoding="utf-8")
 
 
 def _pyinstaller_add_data_arg(source: Path, destination: str) -> str:
@@ -161,9 +220,9 @@ def _build_pyinstaller(
     if not icon_path.exists():
         raise FileNotFoundError(str(icon_path))
 
-    temp_dir = PROJECT_ROOT / ".build_temp"
-    temp_dir.mkdir(parents=True, exist_ok=True)
-    version_file = temp_dir / "version_file.txt"
+    # 版本资源文件不能放进 workpath：--clean 在 EXE 阶段读取之前
+    # 就会清空该目录，放在独立的构建临时目录里跨构建复用
+    version_file = BUILD_TEMP_DIR / "version_file.txt"
     _generate_windows_version_file(
         app_name=PACKAGE_NAME,
         version=version,
@@ -173,16 +232,36 @@ def _build_pyinstaller(
         output_path=version_file,
     )
 
+    # 应用只用到 QtCore/QtGui/QtWidgets，显式排除重量级 Qt 子模块，
+    # 减少 Analysis 阶段的扫描量和最终产物体积
+    excluded_modules = [
+        "PySide6.Qt3DCore",
+        "PySide6.QtMultimedia",
+        "PySide6.QtNetwork",
+        "PySide6.QtOpenGL",
+        "PySide6.QtPdf",
+        "PySide6.QtQml",
+        "PySide6.QtQuick",
+        "PySide6.QtQuickWidgets",
+        "PySide6.QtWebChannel",
+        "PySide6.QtWebEngineCore",
+        "PySide6.QtWebEngineWidgets",
+    ]
+
     cmd = [
         sys.executable,
         "-m",
         "PyInstaller",
         "--noconfirm",
         "--noupx",
+        "--workpath",
+        str(PYINSTALLER_WORK_DIR),
         "--name",
         PACKAGE_NAME,
         "--paths",
         str(SRC_DIR),
+        "--collect-submodules",
+        PACKAGE_NAME,
         "--icon",
         str(icon_path),
         "--add-data",
@@ -190,6 +269,8 @@ def _build_pyinstaller(
         "--version-file",
         str(version_file),
     ]
+    for module in excluded_modules:
+        cmd.extend(["--exclude-module", module])
     if clean:
         cmd.append("--clean")
     if onefile:
@@ -199,7 +280,14 @@ def _build_pyinstaller(
     cmd.append("--noconsole")
     cmd.append(str(ENTRY_SCRIPT))
 
-    _run(cmd, cwd=PROJECT_ROOT)
+    # 每次构建使用独立的 PyInstaller 配置目录，避免 CI 并行构建互相覆盖缓存
+    env = {
+        **os.environ,
+        "PYINSTALLER_CONFIG_DIR": str(
+            PROJECT_ROOT / ".pyinstaller_cfg" / str(os.getpid())
+        ),
+    }
+    _run(cmd, cwd=PROJECT_ROOT, env=env)
 
     dist_dir = PROJECT_ROOT / "dist"
     if onefile:
@@ -221,26 +309,30 @@ def _smoke_test(*, built_executable: Path, onefile: bool) -> None:
             raise FileNotFoundError(str(icon_in_dist))
 
 
-def _cleanup_pyinstaller_artifacts(*, remove_dist: bool) -> None:
+def _cleanup_pyinstaller_artifacts(
+    *, remove_dist: bool, remove_cache: bool = False
+) -> None:
     for pattern in ("*.spec",):
         for p in PROJECT_ROOT.glob(pattern):
             p.unlink(missing_ok=True)
 
-    shutil.rmtree(PROJECT_ROOT / "build", ignore_errors=True)
-    shutil.rmtree(PROJECT_ROOT / ".build_temp", ignore_errors=True)
+    shutil.rmtree(PROJECT_ROOT / ".pyinstaller_cfg", ignore_errors=True)
 
     if remove_dist:
         shutil.rmtree(PROJECT_ROOT / "dist", ignore_errors=True)
-
-    for pycache in PROJECT_ROOT.rglob("__pycache__"):
-        shutil.rmtree(pycache, ignore_errors=True)
+    if remove_cache:
+        # 版本资源及其摘要随缓存一起清理，下次构建重新生成
+        shutil.rmtree(BUILD_TEMP_DIR, ignore_errors=True)
+        shutil.rmtree(PYINSTALLER_WORK_DIR, ignore_errors=True)
 
 
 def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(prog="build.py")
     parser.add_argument("--onedir", action="store_true", help="使用目录模式输出")
     parser.add_argument(
-        "--clean", action="store_true", help="清理 PyInstaller 缓存后再打包"
+        "--clean",
+        action="store_true",
+        help="清理 PyInstaller 缓存后再打包（默认增量构建，复用上次分析结果）",
     )
     parser.add_argument(
         "--skip-smoke-test", action="store_true", help="跳过构建后的冒烟测试"
@@ -261,6 +353,11 @@ def _build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="打包结束后删除 dist 目录",
     )
+    parser.add_argument(
+        "--purge-cache",
+        action="store_true",
+        help="打包结束后删除 .pyinstaller_cache 工作目录",
+    )
     return parser
 
 
@@ -286,7 +383,9 @@ def main() -> int:
             _smoke_test(built_executable=built_executable, onefile=not args.onedir)
             logging.info("冒烟测试通过")
 
-        _cleanup_pyinstaller_artifacts(remove_dist=args.purge_dist)
+        _cleanup_pyinstaller_artifacts(
+            remove_dist=args.purge_dist, remove_cache=args.purge_cache
+        )
         return 0
     except subprocess.CalledProcessError as e:
         logging.error(f"命令执行失败: {e}", exc_info=True)
@@ -7,8 +7,11 @@ from pathlib import Path
 
 
 def main() -> None:
-    project_root = Path(__file__).parent
-    sys.path.insert(0, str(project_root / "src"))
+    # 打包后的可执行文件从 PYZ 归档内解析导入，无需修改 sys.path；
+    # 插入真实目录反而会让每次导入多付 stat() 开销
+    if not getattr(sys, "frozen", False):
+        project_root = Path(__file__).parent
+        sys.path.insert(0, str(project_root / "src"))
     from NetshTool.main import main as app_main
 
     app_main()
@@ -3,11 +3,14 @@
 编排 WiFi 管理的业务流程。
 """
 import logging
+import os
 import tempfile
+import time
+from functools import cached_property
 from pathlib import Path
 
 from ..domain.profile import ConnectionMode, WiFiProfile
-from ..infrastructure.netsh_executor import NetshExecutor
+from ..infrastructure.netsh_executor import NetshExecutor, NetshInterfaceStatus
 from ..infrastructure.profile_xml_generator import ProfileXmlGenerator
 
 logger = logging.getLogger(__name__)
@@ -19,22 +22,55 @@ class WiFiService:
     提供 WiFi 配置文件的增删改查功能。
     """
 
+    # 已保存网络列表的缓存有效期（秒）
+    PROFILES_CACHE_TTL = 2.0
+
     def __init__(self):
         """初始化服务"""
-        self._executor = NetshExecutor()
-        self._xml_generator = ProfileXmlGenerator()
-        self._temp_dir = Path(tempfile.gettempdir()) / "NetshTool"
-        self._temp_dir.mkdir(parents=True, exist_ok=True)
+        self._profiles_cache: tuple[float, bool, list[str]] | None = None
+
+    # 依赖对象按需构建，缩短应用冷启动路径
+
+    @cached_property
+    def _executor(self) -> NetshExecutor:
+        return NetshExecutor()
+
+    @cached_property
+    def _xml_generator(self) -> ProfileXmlGenerator:
+        return ProfileXmlGenerator()
+
+    @cached_property
+    def _temp_dir(self) -> Path:
+        temp_dir = Path(tempfile.gettempdir()) / "NetshTool"
+        temp_dir.mkdir(parents=True, exist_ok=True)
+        return temp_dir
+
+    def _invalidate_profiles_cache(self) -> None:
+        """使已保存网络列表的缓存失效"""
+        self._profiles_cache = None
 
     def get_saved_networks(self) -> tuple[bool, list[str]]:
         """获取已保存的 WiFi 网络列表
 
+        短时间内的重复调用复用缓存结果，避免反复拉起 netsh 进程；
+        增删操作成功后缓存会被主动失效。
+
         Returns:
             (成功标志, WiFi 网络名称列表)
         """
+        cached = self._profiles_cache
+        if (
+            cached is not None
+            and time.monotonic() - cached[0] < self.PROFILES_CACHE_TTL
+        ):
+            return cached[1], cached[2]
+
         success, profiles = self._executor.show_profiles()
         if not success:
+            # 失败结果不进缓存，用户随即重试时可立刻再次查询
             logger.error("获取已保存网络列表失败")
+        else:
+            self._profiles_cache = (time.monotonic(), success, profiles)
         return success, profiles
 
     def add_wifi_network(
@@ -63,18 +99,30 @@ class WiFiService:
                 ),
             )
 
-            # 生成 XML 配置文件
-            xml_content = self._xml_generator.generate_xml(profile)
-
-            # 写入临时文件
-            temp_file_path = self._temp_dir / f"{name}_profile.xml"
-            with open(temp_file_path, "w", encoding="utf-8") as f:
-                f.write(xml_content)
-
-            # 调用 netsh 添加配置
-            success, message = self._executor.add_profile(str(temp_file_path))
+            # 生成 XML 配置文件（UTF-8 字节串，直接落盘）
+            xml_bytes = self._xml_generator.generate_xml_bytes(profile)
+
+            # 写入一次性临时文件，netsh 读取后立即删除，避免残留在临时目录
+            with tempfile.NamedTemporaryFile(
+                "wb",
+                suffix=".xml",
+                dir=self._temp_dir,
+                delete=False,
+            ) as f:
+                f.write(xml_bytes)
+                temp_file_path = f.name
+
+            try:
+                # 调用 netsh 添加配置
+                success, message = self._executor.add_profile(temp_file_path)
+            finally:
+                try:
+                    os.unlink(temp_file_path)
+                except OSError:
+                    logger.warning(f"临时配置文件删除失败: {temp_file_path}")
 
             if success:
+                self._invalidate_profiles_cache()
                 message = f"成功添加 WiFi 网络: {name}"
                 logger.info(message)
             else:
@@ -104,6 +152,7 @@ class WiFiService:
             success, message = self._executor.delete_profile(name)
 
             if success:
+                self._invalidate_profiles_cache()
                 message = f"成功删除 WiFi 网络: {name}"
                 logger.info(message)
             else:
@@ -144,6 +193,65 @@ class WiFiService:
             logger.error(error_msg, exc_info=True)
             return False, error_msg
 
+    def export_wifi_networks(self, names: list[str]) -> tuple[bool, str]:
+        """批量导出多个 WiFi 网络配置
+
+        Args:
+            names: WiFi 网络名称列表
+
+        Returns:
+            (成功标志, 消息)
+        """
+        try:
+            desktop_path = Path.home() / "Desktop"
+            results = self._executor.export_profiles(names, str(desktop_path))
+            failed = [name for name, (ok, _) in zip(names, results) if not ok]
+
+            if failed:
+                error_msg = f"以下网络导出失败: {'、'.join(failed)}"
+                logger.error(error_msg)
+                return False, error_msg
+
+            message = f"已导出 {len(names)} 个配置文件到: {desktop_path}"
+            logger.info(message)
+            return True, message
+
+        except Exception as e:
+            error_msg = f"导出 WiFi 网络时发生异常: {e}"
+            logger.error(error_msg, exc_info=True)
+            return False, error_msg
+
+    def delete_wifi_networks(self, names: list[str]) -> tuple[bool, str]:
+        """批量删除多个 WiFi 网络
+
+        Args:
+            names: WiFi 网络名称列表
+
+        Returns:
+            (成功标志, 消息)
+        """
+        try:
+            results = self._executor.delete_profiles(names)
+            failed = [name for name, (ok, _) in zip(names, results) if not ok]
+
+            # 只要有任一删除成功，缓存即已过期
+            if len(failed) < len(names):
+                self._invalidate_profiles_cache()
+
+            if failed:
+                error_msg = f"以下网络删除失败: {'、'.join(failed)}"
+                logger.error(error_msg)
+                return False, error_msg
+
+            message = f"成功删除 {len(names)} 个 WiFi 网络"
+            logger.info(message)
+            return True, message
+
+        except Exception as e:
+            error_msg = f"删除 WiFi 网络时发生异常: {e}"
+            logger.error(error_msg, exc_info=True)
+            return False, error_msg
+
     def delete_all_networks(self) -> tuple[bool, str]:
         """删除所有 WiFi 网络
 
@@ -154,6 +262,7 @@ class WiFiService:
             success, message = self._executor.delete_all_profiles()
 
             if success:
+                self._invalidate_profiles_cache()
                 message = "已成功删除所有 WiFi 配置文件"
                 logger.info(message)
             else:
@@ -166,15 +275,31 @@ class WiFiService:
             logger.error(error_msg, exc_info=True)
             return False, error_msg
 
-    def get_connected_network(self) -> str | None:
-        status = self._executor.get_interface_status()
-        state = status.state or ""
-        normalized = state.strip().lower()
-        is_connected = ("connected" in normalized) or ("已连接" in state)
-        if not is_connected:
+    def get_networks_overview(self) -> tuple[bool, list[str], str | None]:
+        """一次调用同时获取已保存网络列表和当前连接的网络
+
+        两项查询合并到同一次 netsh 子进程调用中，供界面刷新使用。
+
+        Returns:
+            (成功标志, WiFi 网络名称列表, 当前连接的网络名称)
+        """
+        status, success, profiles = self._executor.show_interfaces_and_profiles()
+        if not success:
+            logger.error("获取已保存网络列表失败")
+        else:
+            self._profiles_cache = (time.monotonic(), success, profiles)
+        return success, profiles, self._connected_name_from_status(status)
+
+    @staticmethod
+    def _connected_name_from_status(status: NetshInterfaceStatus) -> str | None:
+        if not NetshExecutor._is_connected_state(status.state):
             return None
         if status.profile is not None:
             return status.profile
         if status.ssid is not None:
             return status.ssid
         return None
+
+    def get_connected_network(self) -> str | None:
+        status = self._executor.get_interface_status()
+        return self._connected_name_from_status(status)
@@ -2,7 +2,7 @@
 
 定义 WiFi 网络列表的数据结构。
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass
@@ -10,14 +10,19 @@ class WiFiNetworkList:
     """WiFi 网络列表实体
 
     Attributes:
-        profiles: WiFi 配置文件名称列表
+        profiles: WiFi 配置文件名称列表（保持显示顺序）
     """
     profiles: list[str]
+    # 基于 frozenset 的索引，使 contains 为 O(1)
+    _index: frozenset[str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        self._index = frozenset(self.profiles)
 
     def is_empty(self) -> bool:
         """检查是否为空列表"""
-        return len(self.profiles) == 0
+        return not self._index
 
     def contains(self, name: str) -> bool:
         """检查是否包含指定 WiFi 网络"""
-        return name in self.profiles
+        return name in self._index
@@ -2,7 +2,7 @@
 
 定义 WiFi 配置文件的数据结构和业务逻辑。
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -38,6 +38,7 @@ class WiFiProfile:
         encryption_type: 加密类型
         auto_switch: 是否自动切换网络
         enable_randomization: 是否启用 MAC 地址随机化
+        ssid_hex: SSID 的十六进制表示（构造时计算）
     """
     name: str
     password: str
@@ -46,6 +47,7 @@ class WiFiProfile:
     encryption_type: EncryptionType = EncryptionType.AES
     auto_switch: bool = False
     enable_randomization: bool = True
+    ssid_hex: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """数据验证"""
@@ -53,11 +55,8 @@ class WiFiProfile:
             raise ValueError("WiFi 网络名称不能为空")
         if not self.password or len(self.password) < 8:
             raise ValueError("WiFi 密码长度至少为 8 个字符")
-
-    @property
-    def ssid_hex(self) -> str:
-        """获取 SSID 的十六进制表示"""
-        return self.name.encode("utf-8").hex().upper()
+        # 名称校验通过后即缓存十六进制 SSID，序列化时直接读取
+        self.ssid_hex = self.name.encode("utf-8").hex().upper()
 
     def to_dict(self) -> dict:
         """转换为字典格式"""
@@ -5,13 +5,28 @@
 from __future__ import annotations
 
 import logging
+import re
+import shutil
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import Any
 
+from . import wlan_api
+
 logger = logging.getLogger(__name__)
 
+# 批量执行多条 netsh 查询时用于切分各段输出的哨兵行
+_BATCH_SENTINEL = "__NETSH_TOOL_SPLIT__"
+
+# 判定已连接状态的标记（中英文系统），模块级常量避免每次调用重建
+_CONNECTED_TOKENS = ("connected", "已连接")
+
+# netsh 的绝对路径只解析一次，省去每次 CreateProcess 前的 PATH 查找
+_NETSH = shutil.which("netsh") or "netsh"
+
 
 @dataclass(frozen=True)
 class NetshInterfaceStatus:
@@ -21,15 +36,106 @@ class NetshInterfaceStatus:
     profile: str | None
 
 
+@dataclass(frozen=True)
+class _CachedResult:
+    """只读查询的缓存条目"""
+    timestamp: float
+    success: bool
+    output: str
+
+
 class NetshExecutor:
     """netsh 指令执行器
 
     负责执行 netsh wlan 相关命令并处理返回结果。
+    只读查询（show 系列）结果带短 TTL 缓存，密集轮询时复用内存结果。
     """
 
+    # 只读查询结果的缓存有效期（秒）
+    QUERY_CACHE_TTL = 0.3
+
+    # show profiles 输出中配置文件行的匹配模式（中英文系统）
+    _PROFILE_LINE_RE = re.compile(
+        r"(?:All User Profile|所有用户配置文件)\s*:\s*(.+?)\s*(?:\r?\n|\Z)"
+    )
+
+    # show interfaces 输出中关注的键值行（中英文系统），单趟扫描提取
+    _STATUS_LINE_RE = re.compile(
+        r"^\s*(?P<key>name|名称|state|状态|ssid|profile|配置文件)"
+        r"\s*:\s*(?P<value>\S.*?)\s*$",
+        re.MULTILINE | re.IGNORECASE,
+    )
+
+    # 通用的 "键 : 值" 行匹配模式，供 _extract_value 单趟扫描使用
+    _KV_LINE_RE = re.compile(
+        r"^[ \t]*([^\s:][^:\n\r]*?)[ \t]*:[ \t]*(\S.*?)[ \t]*$",
+        re.MULTILINE,
+    )
+
+    # 键名（小写）到 NetshInterfaceStatus 字段的映射
+    _STATUS_FIELD_BY_KEY = {
+        "name": "interface_name",
+        "名称": "interface_name",
+        "state": "state",
+        "状态": "state",
+        "ssid": "ssid",
+        "profile": "profile",
+        "配置文件": "profile",
+    }
+
+    def __init__(self):
+        self._query_cache: dict[tuple[str, ...], _CachedResult] = {}
+
+    @staticmethod
+    def _is_query_command(command: list[str]) -> bool:
+        """判断是否为只读的 show 查询命令
+
+        只看子命令所在的固定位置，避免配置文件名或文件路径中
+        恰好含有 show（如 name=roadshow）时把写操作误判为可缓存查询。
+        """
+        if not command:
+            return False
+        if command[0] == "cmd":
+            # cmd 批量调用仅由 show_interfaces_and_profiles 构造查询串
+            return "show" in command[-1].split()
+        return len(command) > 2 and command[2] == "show"
+
+    def _invalidate_query_cache(self) -> None:
+        """配置变更后清空查询缓存"""
+        self._query_cache.clear()
+
+    @staticmethod
+    def _with_utf8_console(command: list[str]) -> list[str]:
+        """Windows 下切换代码页到 65001，让 netsh 直接输出 UTF-8
+
+        包装后命令经 cmd 按字符串重新解析，因此只允许用于
+        固定字符串的 show 查询；携带用户输入（配置文件名、文件
+        路径）的写命令必须保持 argv 直接执行，防止元字符注入。
+
+        Args:
+            command: 原始命令列表
+
+        Returns:
+            包装后的命令列表（非 Windows 环境原样返回）
+        """
+        if not sys.platform.startswith("win"):
+            return command
+        if command[0] == "cmd":
+            # 已经是 cmd 调用，直接在命令串前切换代码页
+            return command[:-1] + [f"chcp 65001 >NUL & {command[-1]}"]
+        return [
+            "cmd",
+            "/d",
+            "/c",
+            f"chcp 65001 >NUL & {subprocess.list2cmdline(command)}",
+        ]
+
     @staticmethod
     def _decode_output(data: bytes) -> str:
-        """尝试多种编码解码输出
+        """解码命令输出
+
+        代码页已切换为 65001，优先按 UTF-8 解码；
+        仅在失败时退回旧的多编码尝试，兼容 chcp 不可用的环境。
 
         Args:
             data: 字节数据
@@ -37,18 +143,22 @@ class NetshExecutor:
         Returns:
             解码后的字符串
         """
-        # 尝试多种常见编码
-        encodings = ["gbk", "gb2312", "utf-8", "cp936"]
-        for encoding in encodings:
+        if not data:
+            return ""
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+        # 兼容旧环境的多编码尝试
+        for encoding in ("gbk", "gb2312", "cp936"):
             try:
                 return data.decode(encoding)
             except (UnicodeDecodeError, LookupError):
                 continue
         # 如果都失败，使用错误忽略模式
-        return data.decode("gbk", errors="ignore")
+        return data.decode("utf-8", errors="replace")
 
-    @staticmethod
-    def _run_command(command: list[str]) -> tuple[bool, str]:
+    def _run_command(self, command: list[str]) -> tuple[bool, str]:
         """执行 shell 命令
 
         Args:
@@ -57,45 +167,67 @@ class NetshExecutor:
         Returns:
             (成功标志, 输出内容)
         """
+        key = tuple(command)
+        if self._is_query_command(command):
+            cached = self._query_cache.get(key)
+            if (
+                cached is not None
+                and time.monotonic() - cached.timestamp < self.QUERY_CACHE_TTL
+            ):
+                return cached.success, cached.output
+
         try:
             run_kwargs: dict[str, Any] = {
-                "capture_output": True,
+                "stdout": subprocess.PIPE,
+                "stderr": subprocess.STDOUT,
+                # 显式块缓冲，配置文件很多时减少小段管道读取
+                "bufsize": -1,
                 "check": False,
             }
             if sys.platform.startswith("win"):
                 create_no_window = getattr(subprocess, "CREATE_NO_WINDOW", 0)
                 if isinstance(create_no_window, int) and create_no_window != 0:
                     run_kwargs["creationflags"] = create_no_window
+            # 只有固定字符串的查询命令走 chcp 包装；写命令的参数
+            # 含有用户输入，直接按 argv 执行，解码走多编码回退
+            run_command = (
+                self._with_utf8_console(command)
+                if self._is_query_command(command)
+                else command
+            )
             result = subprocess.run(
-                command,
+                run_command,
                 **run_kwargs,
             )
             success = result.returncode == 0
-            # 使用自定义解码方法
-            stdout = NetshExecutor._decode_output(result.stdout)
-            stderr = NetshExecutor._decode_output(result.stderr)
-            output = stdout + stderr
+            # stderr 已在管道层并入 stdout，只需一次解码
+            output = NetshExecutor._decode_output(result.stdout)
+            if self._is_query_command(command):
+                self._query_cache[key] = _CachedResult(
+                    time.monotonic(), success, output
+                )
             return success, output
         except Exception as e:
             logger.error(f"命令执行异常: {e}")
             return False, str(e)
 
-    @staticmethod
-    def _extract_value(output: str, keys: set[str]) -> str | None:
-        for raw_line in output.splitlines():
-            line = raw_line.strip()
-            if not line or ":" not in line:
-                continue
-            left, right = line.split(":", 1)
-            key = left.strip().lower()
-            if key in keys:
-                value = right.strip()
-                if value:
-                    return value
+    @classmethod
+    def _extract_value(cls, output: str, keys: set[str]) -> str | None:
+        for m in cls._KV_LINE_RE.finditer(output):
+            if m.group(1).lower() in keys:
+                return m.group(2)
         return None
 
     def get_interface_status(self) -> NetshInterfaceStatus:
-        success, output = self._run_command(["netsh", "wlan", "show", "interfaces"])
+        # 优先走进程内的 WLAN API，失败时回退到 netsh 文本解析
+        api_status = wlan_api.get_interface_status()
+        if api_status is not None:
+            interface_name, state, ssid, profile = api_status
+            return NetshInterfaceStatus(
+                interface_name=interface_name, state=state, ssid=ssid, profile=profile
+            )
+
+        success, output = self._run_command([_NETSH, "wlan", "show", "interfaces"])
         if not success and not output:
             return NetshInterfaceStatus(
                 interface_name=None, state=None, ssid=None, profile=None
@@ -104,44 +236,70 @@ class NetshExecutor:
 
     @classmethod
     def _parse_interface_status(cls, output: str) -> NetshInterfaceStatus:
-        interface_name: str | None = None
-        state: str | None = None
-        ssid: str | None = None
-        profile: str | None = None
-
-        for raw_line in output.splitlines():
-            line = raw_line.strip()
-            if not line or ":" not in line:
-                continue
-            left, right = line.split(":", 1)
-            key = left.strip().lower()
-            value = right.strip()
-            if not value:
-                continue
-
-            if key in {"name", "名称"}:
-                interface_name = value
-                continue
-            if key in {"state", "状态"}:
-                state = value
-                continue
-            if key.startswith("ssid"):
-                ssid = value
-                continue
-            if key in {"profile", "配置文件"}:
-                profile = value
-                continue
-
-        return NetshInterfaceStatus(
-            interface_name=interface_name, state=state, ssid=ssid, profile=profile
-        )
+        fields: dict[str, str | None] = {
+            "interface_name": None,
+            "state": None,
+            "ssid": None,
+            "profile": None,
+        }
+        for m in cls._STATUS_LINE_RE.finditer(output):
+            field = cls._STATUS_FIELD_BY_KEY[m.group("key").lower()]
+            fields[field] = m.group("value")
+        return NetshInterfaceStatus(**fields)
 
     @staticmethod
     def _is_connected_state(state: str | None) -> bool:
         if state is None:
             return False
         normalized = state.strip().lower()
-        return ("connected" in normalized) or ("已连接" in state)
+        return any(token in normalized for token in _CONNECTED_TOKENS)
+
+    @staticmethod
+    def _wlan_is_connected_to(name: str) -> bool | None:
+        """通过 WLAN API 判断当前是否连接到指定网络
+
+        直接比较 WlanQueryInterface 返回的配置文件名和 SSID，
+        完全绕开 netsh 子进程和文本解析。
+
+        Args:
+            name: WiFi 网络名称
+
+        Returns:
+            连接判定结果；WLAN API 不可用时返回 None
+        """
+        api_status = wlan_api.get_interface_status()
+        if api_status is None:
+            return None
+        _, state, ssid, profile = api_status
+        if state != "connected":
+            return False
+        return name in (profile, ssid)
+
+    def is_connected_to(self, name: str) -> bool:
+        """判断当前是否连接到指定的 WiFi 网络
+
+        优先走进程内的 WLAN API 做字符串直比，
+        失败时回退到 netsh 接口状态查询。
+
+        Args:
+            name: WiFi 网络名称
+
+        Returns:
+            是否已连接到该网络
+        """
+        api_result = self._wlan_is_connected_to(name)
+        if api_result is not None:
+            return api_result
+
+        status = self.get_interface_status()
+        if not self._is_connected_state(status.state):
+            return False
+        return name in (status.profile, status.ssid)
+
+    @classmethod
+    def _parse_profiles(cls, output: str) -> list[str]:
+        """从 show profiles 输出中提取配置文件名称列表"""
+        return [m.group(1) for m in cls._PROFILE_LINE_RE.finditer(output)]
 
     def show_profiles(self) -> tuple[bool, list[str]]:
         """获取所有已保存的 WiFi 配置文件
@@ -149,24 +307,72 @@ class NetshExecutor:
         Returns:
             (成功标志, WiFi 配置文件名称列表)
         """
-        success, output = self._run_command(["netsh", "wlan", "show", "profiles"])
+        # 优先走进程内的 WLAN API，失败时回退到 netsh 文本解析
+        api_profiles = wlan_api.list_profile_names()
+        if api_profiles is not None:
+            if api_profiles:
+                logger.info(f"已获取 {len(api_profiles)} 个已保存的网络")
+            return True, api_profiles
+
+        success, output = self._run_command([_NETSH, "wlan", "show", "profiles"])
         if not success:
             return False, []
 
-        profiles: list[str] = []
-        for line in output.split("\n"):
-            line = line.strip()
-            if "所有用户配置文件" in line or "All User Profile" in line:
-                parts = line.split(":")
-                if len(parts) >= 2:
-                    profile_name = ":".join(parts[1:]).strip()
-                    if profile_name:
-                        profiles.append(profile_name)
-
+        profiles = self._parse_profiles(output)
         if profiles:
             logger.info(f"已获取 {len(profiles)} 个已保存的网络")
         return True, profiles
 
+    def show_interfaces_and_profiles(
+        self,
+    ) -> tuple[NetshInterfaceStatus, bool, list[str]]:
+        """在一次子进程调用中同时获取接口状态和配置文件列表
+
+        Windows 下通过 cmd 把两条 netsh 查询合并为一次进程创建，
+        输出以哨兵行切分；失败或非 Windows 环境退回两次独立调用。
+
+        Returns:
+            (接口状态, 成功标志, WiFi 配置文件名称列表)
+        """
+        # WLAN API 可用时两项查询都在进程内完成，无需批量 netsh 调用
+        api_status = wlan_api.get_interface_status()
+        api_profiles = wlan_api.list_profile_names()
+        if api_status is not None and api_profiles is not None:
+            interface_name, state, ssid, profile = api_status
+            if api_profiles:
+                logger.info(f"已获取 {len(api_profiles)} 个已保存的网络")
+            return (
+                NetshInterfaceStatus(
+                    interface_name=interface_name,
+                    state=state,
+                    ssid=ssid,
+                    profile=profile,
+                ),
+                True,
+                api_profiles,
+            )
+
+        if sys.platform.startswith("win"):
+            batch = (
+                f"{_NETSH} wlan show interfaces"
+                f" & echo {_BATCH_SENTINEL}"
+                f" & {_NETSH} wlan show profiles"
+            )
+            success, output = self._run_command(["cmd", "/d", "/c", batch])
+            if success and _BATCH_SENTINEL in output:
+                interfaces_output, profiles_output = output.split(
+                    _BATCH_SENTINEL, 1
+                )
+                status = self._parse_interface_status(interfaces_output)
+                profiles = self._parse_profiles(profiles_output)
+                if profiles:
+                    logger.info(f"已获取 {len(profiles)} 个已保存的网络")
+                return status, True, profiles
+
+        status = self.get_interface_status()
+        success, profiles = self.show_profiles()
+        return status, success, profiles
+
     def export_profile(self, name: str, output_path: str) -> tuple[bool, str]:
         """导出 WiFi 配置文件到 XML
 
@@ -178,7 +384,7 @@ class NetshExecutor:
             (成功标志, 消息)
         """
         success, output = self._run_command([
-            "netsh",
+            _NETSH,
             "wlan",
             "export",
             "profile",
@@ -203,12 +409,13 @@ class NetshExecutor:
             (成功标志, 消息)
         """
         success, output = self._run_command([
-            "netsh",
+            _NETSH,
             "wlan",
             "add",
             "profile",
             f"filename={xml_path}",
         ])
+        self._invalidate_query_cache()
 
         if success:
             logger.info(f"成功添加配置文件: {xml_path}")
@@ -227,12 +434,13 @@ class NetshExecutor:
             (成功标志, 消息)
         """
         success, output = self._run_command([
-            "netsh",
+            _NETSH,
             "wlan",
             "delete",
             "profile",
             f"name={name}",
         ])
+        self._invalidate_query_cache()
 
         if success:
             logger.info(f"成功删除配置文件: {name}")
@@ -241,6 +449,46 @@ class NetshExecutor:
             logger.error(f"删除配置文件失败: {name}")
             return False, f"删除失败: {output}"
 
+    def export_profiles(
+        self, names: list[str], output_path: str, max_workers: int = 8
+    ) -> list[tuple[bool, str]]:
+        """并发导出多个 WiFi 配置文件
+
+        各配置文件的导出互相独立且以等待子进程为主，
+        使用线程池并发执行以缩短批量操作的总耗时。
+
+        Args:
+            names: WiFi 网络名称列表
+            output_path: 输出目录路径
+            max_workers: 最大并发数
+
+        Returns:
+            与 names 顺序对应的 (成功标志, 消息) 列表
+        """
+        if not names:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(
+                pool.map(lambda name: self.export_profile(name, output_path), names)
+            )
+
+    def delete_profiles(
+        self, names: list[str], max_workers: int = 8
+    ) -> list[tuple[bool, str]]:
+        """并发删除多个 WiFi 配置文件
+
+        Args:
+            names: WiFi 网络名称列表
+            max_workers: 最大并发数
+
+        Returns:
+            与 names 顺序对应的 (成功标志, 消息) 列表
+        """
+        if not names:
+            return []
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.delete_profile, names))
+
     def delete_all_profiles(self) -> tuple[bool, str]:
         """删除所有 WiFi 配置文件
 
@@ -248,12 +496,13 @@ class NetshExecutor:
             (成功标志, 消息)
         """
         success, output = self._run_command([
-            "netsh",
+            _NETSH,
             "wlan",
             "delete",
             "profile",
             "*",
         ])
+        self._invalidate_query_cache()
 
         if success:
             logger.info("已删除所有配置文件")
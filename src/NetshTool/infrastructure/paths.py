@@ -1,9 +1,29 @@
+import sys
+from functools import cache
 from pathlib import Path
 
+# PyInstaller 冻结状态与资源基准目录只在导入时判定一次，
+# 各入口统一从这里取，避免到处重复 frozen/_MEIPASS 分支
+IS_FROZEN = bool(getattr(sys, "frozen", False))
 
+if IS_FROZEN:
+    # 单文件打包解压目录，目录打包时退回可执行文件所在目录
+    _BASE_PATH = Path(getattr(sys, "_MEIPASS", Path(sys.executable).parent))
+else:
+    _BASE_PATH = None
+
+
+@cache
 def get_project_root() -> Path:
     """获取项目根目录"""
-    # 从 infrastructure/paths.py 向上 3 层是 NetshTool/
-    # 再向上 1 层是 src/
-    # 再向上 1 层是项目根目录
-    return Path(__file__).parent.parent.parent.parent
+    # infrastructure/paths.py 向上依次是 NetshTool/、src/、项目根目录
+    return Path(__file__).resolve().parents[3]
+
+
+@cache
+def get_icon_path() -> Path:
+    """获取图标文件路径"""
+    if IS_FROZEN:
+        return _BASE_PATH / "NetshTool" / "image" / "icon.ico"
+    # 开发环境
+    return get_project_root() / "src" / "NetshTool" / "image" / "icon.ico"
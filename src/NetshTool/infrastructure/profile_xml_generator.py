@@ -3,8 +3,7 @@
 根据 WiFi 配置实体生成 XML 格式的配置文件。
 """
 import logging
-from xml.dom import minidom
-from xml.etree.ElementTree import Element, SubElement, tostring
+from xml.sax.saxutils import escape
 
 from ..domain.profile import WiFiProfile
 
@@ -15,24 +14,46 @@ class ProfileXmlGenerator:
     """WiFi 配置文件 XML 生成器
 
     负责将 WiFiProfile 实体转换为 Windows WiFi 配置 XML 格式。
+    配置文件结构固定，直接基于预定义模板做文本替换，
+    无需逐节点构建 DOM 树再序列化。
     """
 
     NAMESPACE_V1 = "http://www.microsoft.com/networking/WLAN/profile/v1"
     NAMESPACE_V3 = "http://www.microsoft.com/networking/WLAN/profile/v3"
 
-    @staticmethod
-    def _prettify(element: Element) -> str:
-        """美化 XML 输出
-
-        Args:
-            element: XML 元素
-
-        Returns:
-            格式化后的 XML 字符串
-        """
-        rough_string = tostring(element, encoding="utf-8")
-        reparsed = minidom.parseString(rough_string)
-        return reparsed.toprettyxml(indent="\t", encoding="utf-8").decode("utf-8")
+    _XML_TEMPLATE = (
+        "<?xml version='1.0' encoding='utf-8'?>\n"
+        f'<WLANProfile xmlns="{NAMESPACE_V1}">\n'
+        "\t<name>{name}</name>\n"
+        "\t<SSIDConfig>\n"
+        "\t\t<SSID>\n"
+        "\t\t\t<hex>{ssid_hex}</hex>\n"
+        "\t\t\t<name>{name}</name>\n"
+        "\t\t</SSID>\n"
+        "\t\t<nonBroadcast>false</nonBroadcast>\n"
+        "\t</SSIDConfig>\n"
+        "\t<connectionType>ESS</connectionType>\n"
+        "\t<connectionMode>{connection_mode}</connectionMode>\n"
+        "\t<autoSwitch>{auto_switch}</autoSwitch>\n"
+        "\t<MSM>\n"
+        "\t\t<security>\n"
+        "\t\t\t<authEncryption>\n"
+        "\t\t\t\t<authentication>{authentication}</authentication>\n"
+        "\t\t\t\t<encryption>{encryption}</encryption>\n"
+        "\t\t\t\t<useOneX>false</useOneX>\n"
+        "\t\t\t</authEncryption>\n"
+        "\t\t\t<sharedKey>\n"
+        "\t\t\t\t<keyType>passPhrase</keyType>\n"
+        "\t\t\t\t<protected>false</protected>\n"
+        "\t\t\t\t<keyMaterial>{password}</keyMaterial>\n"
+        "\t\t\t</sharedKey>\n"
+        "\t\t</security>\n"
+        "\t</MSM>\n"
+        f'\t<MacRandomization xmlns="{NAMESPACE_V3}">\n'
+        "\t\t<enableRandomization>{enable_randomization}</enableRandomization>\n"
+        "\t</MacRandomization>\n"
+        "</WLANProfile>\n"
+    )
 
     def generate_xml(self, profile: WiFiProfile) -> str:
         """生成 WiFi 配置文件的 XML 内容
@@ -43,63 +64,28 @@ class ProfileXmlGenerator:
         Returns:
             XML 格式的字符串
         """
-        root = Element("WLANProfile")
-        root.set("xmlns", self.NAMESPACE_V1)
-
-        # name
-        name_elem = SubElement(root, "name")
-        name_elem.text = profile.name
-
-        # SSIDConfig
-        ssid_config = SubElement(root, "SSIDConfig")
-        ssid = SubElement(ssid_config, "SSID")
-        hex_elem = SubElement(ssid, "hex")
-        hex_elem.text = profile.ssid_hex
-        ssid_name_elem = SubElement(ssid, "name")
-        ssid_name_elem.text = profile.name
-        non_broadcast = SubElement(ssid_config, "nonBroadcast")
-        non_broadcast.text = "false"
-
-        # connectionType
-        connection_type = SubElement(root, "connectionType")
-        connection_type.text = "ESS"
-
-        # connectionMode
-        connection_mode = SubElement(root, "connectionMode")
-        connection_mode.text = profile.connection_mode.value
-
-        # autoSwitch
-        auto_switch = SubElement(root, "autoSwitch")
-        auto_switch.text = str(profile.auto_switch).lower()
-
-        # MSM - security
-        msm = SubElement(root, "MSM")
-        security = SubElement(msm, "security")
+        xml_content = self._XML_TEMPLATE.format(
+            name=escape(profile.name),
+            ssid_hex=profile.ssid_hex,
+            connection_mode=profile.connection_mode.value,
+            auto_switch=str(profile.auto_switch).lower(),
+            authentication=profile.authentication_type.value,
+            encryption=profile.encryption_type.value,
+            password=escape(profile.password),
+            enable_randomization=str(profile.enable_randomization).lower(),
+        )
+        logger.info(f"成功生成配置文件 XML: {profile.name}")
+        return xml_content
 
-        # authEncryption
-        auth_encryption = SubElement(security, "authEncryption")
-        authentication = SubElement(auth_encryption, "authentication")
-        authentication.text = profile.authentication_type.value
-        encryption = SubElement(auth_encryption, "encryption")
-        encryption.text = profile.encryption_type.value
-        use_one_x = SubElement(auth_encryption, "useOneX")
-        use_one_x.text = "false"
+    def generate_xml_bytes(self, profile: WiFiProfile) -> bytes:
+        """生成 UTF-8 编码的 WiFi 配置文件 XML 内容
 
-        # sharedKey
-        shared_key = SubElement(security, "sharedKey")
-        key_type = SubElement(shared_key, "keyType")
-        key_type.text = "passPhrase"
-        protected = SubElement(shared_key, "protected")
-        protected.text = "false"
-        key_material = SubElement(shared_key, "keyMaterial")
-        key_material.text = profile.password
+        直接返回字节串，写文件的调用方可省去额外的编码往返。
 
-        # MacRandomization (v3 namespace)
-        mac_randomization = SubElement(root, "MacRandomization")
-        mac_randomization.set("xmlns", self.NAMESPACE_V3)
-        enable_randomization = SubElement(mac_randomization, "enableRandomization")
-        enable_randomization.text = str(profile.enable_randomization).lower()
+        Args:
+            profile: WiFi 配置文件实体
 
-        xml_content = self._prettify(root)
-        logger.info(f"成功生成配置文件 XML: {profile.name}")
-        return xml_content
+        Returns:
+            UTF-8 编码的 XML 字节串
+        """
+        return self.generate_xml(profile).encode("utf-8")
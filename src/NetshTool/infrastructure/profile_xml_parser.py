@@ -2,6 +2,7 @@
 
 解析 XML 格式的 WiFi 配置文件。
 """
+import io
 import logging
 import xml.etree.ElementTree as ET
 
@@ -23,9 +24,28 @@ class ProfileXmlParser:
 
     NAMESPACE_V1 = "http://www.microsoft.com/networking/WLAN/profile/v1"
 
+    # 枚举值到枚举成员的查找表，未知取值走 .get 默认而非异常
+    _MODE_BY_VALUE = {mode.value: mode for mode in ConnectionMode}
+    _AUTH_BY_VALUE = {auth.value: auth for auth in AuthenticationType}
+    _ENC_BY_VALUE = {enc.value: enc for enc in EncryptionType}
+
+    # 单趟扫描时按本地标签名收集的元素（忽略命名空间前缀）
+    _WANTED_TAGS = frozenset({
+        "name",
+        "connectionMode",
+        "authentication",
+        "encryption",
+        "autoSwitch",
+        "keyMaterial",
+        "enableRandomization",
+    })
+
     def parse_xml(self, xml_content: str) -> WiFiProfile | None:
         """解析 XML 配置文件
 
+        单趟 iterparse 扫描按本地标签名收集关注的元素文本，
+        同时兼容带默认命名空间（netsh 导出）和无命名空间的文档。
+
         Args:
             xml_content: XML 内容字符串
 
@@ -33,60 +53,53 @@ class ProfileXmlParser:
             WiFiProfile 实体，解析失败返回 None
         """
         try:
-            root = ET.fromstring(xml_content)
+            values: dict[str, str | None] = {}
+            for _, elem in ET.iterparse(io.StringIO(xml_content)):
+                local_tag = elem.tag.rsplit("}", 1)[-1]
+                if local_tag in self._WANTED_TAGS:
+                    # WLANProfile/name 先于 SSID/name 出现，保留首个值
+                    values.setdefault(local_tag, elem.text)
+                elem.clear()
 
             # 解析 name
-            name_elem = root.find("name")
-            if name_elem is None:
+            if "name" not in values:
                 logger.error("XML 中缺少 name 元素")
                 return None
-            name = name_elem.text or ""
+            name = values["name"] or ""
 
             # 解析 connectionMode
-            connection_mode = ConnectionMode.AUTO
-            connection_mode_elem = root.find("connectionMode")
-            if connection_mode_elem is not None:
-                mode_text = connection_mode_elem.text or "auto"
-                connection_mode = ConnectionMode(mode_text)
+            mode_text = values.get("connectionMode") or "auto"
+            connection_mode = self._MODE_BY_VALUE.get(
+                mode_text, ConnectionMode.AUTO
+            )
 
             # 解析 authenticationType
-            auth_elem = root.find(".//{http://www.microsoft.com/networking/WLAN/profile/v1}authentication")
-            auth_type = AuthenticationType.WPA2PSK
-            if auth_elem is not None:
-                auth_text = auth_elem.text or "WPA2PSK"
-                try:
-                    auth_type = AuthenticationType(auth_text)
-                except ValueError:
-                    logger.warning(f"未知认证类型: {auth_text}，使用默认值 WPA2PSK")
+            auth_text = values.get("authentication") or "WPA2PSK"
+            auth_type = self._AUTH_BY_VALUE.get(auth_text)
+            if auth_type is None:
+                logger.warning(f"未知认证类型: {auth_text}，使用默认值 WPA2PSK")
+                auth_type = AuthenticationType.WPA2PSK
 
             # 解析 encryptionType
-            enc_elem = root.find(".//{http://www.microsoft.com/networking/WLAN/profile/v1}encryption")
-            enc_type = EncryptionType.AES
-            if enc_elem is not None:
-                enc_text = enc_elem.text or "AES"
-                try:
-                    enc_type = EncryptionType(enc_text)
-                except ValueError:
-                    logger.warning(f"未知加密类型: {enc_text}，使用默认值 AES")
+            enc_text = values.get("encryption") or "AES"
+            enc_type = self._ENC_BY_VALUE.get(enc_text)
+            if enc_type is None:
+                logger.warning(f"未知加密类型: {enc_text}，使用默认值 AES")
+                enc_type = EncryptionType.AES
 
             # 解析 autoSwitch
-            auto_switch = False
-            auto_switch_elem = root.find("autoSwitch")
-            if auto_switch_elem is not None:
-                auto_switch = auto_switch_elem.text == "true"
+            auto_switch = values.get("autoSwitch") == "true"
 
             # 解析 password
-            password_elem = root.find(".//{http://www.microsoft.com/networking/WLAN/profile/v1}keyMaterial")
-            if password_elem is None:
+            if "keyMaterial" not in values:
                 logger.error("XML 中缺少 keyMaterial 元素")
                 return None
-            password = password_elem.text or ""
+            password = values["keyMaterial"] or ""
 
             # 解析 enableRandomization
             enable_randomization = True
-            rand_elem = root.find(".//{http://www.microsoft.com/networking/WLAN/profile/v3}enableRandomization")
-            if rand_elem is not None:
-                enable_randomization = rand_elem.text == "true"
+            if "enableRandomization" in values:
+                enable_randomization = values["enableRandomization"] == "true"
 
             profile = WiFiProfile(
                 name=name,
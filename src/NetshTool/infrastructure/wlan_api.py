@@ -0,0 +1,271 @@
+"""WLAN API 封装
+
+通过 ctypes 直接调用 wlanapi.dll 获取接口状态和配置文件列表，
+省去为每次查询拉起 netsh 进程再解析文本的开销。
+非 Windows 环境或调用失败时各接口返回 None，由调用方回退到 netsh。
+"""
+from __future__ import annotations
+
+import ctypes
+import logging
+import sys
+from ctypes import POINTER, Structure, byref
+
+logger = logging.getLogger(__name__)
+
+# WLAN_INTERFACE_STATE 中的已连接状态
+_WLAN_INTERFACE_STATE_CONNECTED = 1
+# WLAN_INTF_OPCODE：查询当前连接属性
+_WLAN_INTF_OPCODE_CURRENT_CONNECTION = 7
+# WlanOpenHandle 请求的客户端版本（Vista 及以上）
+_WLAN_CLIENT_VERSION = 2
+
+_DOT11_SSID_MAX_LENGTH = 32
+_WLAN_MAX_NAME_LENGTH = 256
+
+_ERROR_SUCCESS = 0
+
+
+class _GUID(Structure):
+    _fields_ = [
+        ("Data1", ctypes.c_ulong),
+        ("Data2", ctypes.c_ushort),
+        ("Data3", ctypes.c_ushort),
+        ("Data4", ctypes.c_ubyte * 8),
+    ]
+
+
+class _DOT11_SSID(Structure):
+    _fields_ = [
+        ("uSSIDLength", ctypes.c_ulong),
+        ("ucSSID", ctypes.c_char * _DOT11_SSID_MAX_LENGTH),
+    ]
+
+
+class _WLAN_INTERFACE_INFO(Structure):
+    _fields_ = [
+        ("InterfaceGuid", _GUID),
+        ("strInterfaceDescription", ctypes.c_wchar * _WLAN_MAX_NAME_LENGTH),
+        ("isState", ctypes.c_uint),
+    ]
+
+
+class _WLAN_INTERFACE_INFO_LIST(Structure):
+    _fields_ = [
+        ("dwNumberOfItems", ctypes.c_ulong),
+        ("dwIndex", ctypes.c_ulong),
+        ("InterfaceInfo", _WLAN_INTERFACE_INFO * 1),
+    ]
+
+
+class _WLAN_PROFILE_INFO(Structure):
+    _fields_ = [
+        ("strProfileName", ctypes.c_wchar * _WLAN_MAX_NAME_LENGTH),
+        ("dwFlags", ctypes.c_ulong),
+    ]
+
+
+class _WLAN_PROFILE_INFO_LIST(Structure):
+    _fields_ = [
+        ("dwNumberOfItems", ctypes.c_ulong),
+        ("dwIndex", ctypes.c_ulong),
+        ("ProfileInfo", _WLAN_PROFILE_INFO * 1),
+    ]
+
+
+class _WLAN_ASSOCIATION_ATTRIBUTES(Structure):
+    _fields_ = [
+        ("dot11Ssid", _DOT11_SSID),
+        ("dot11BssType", ctypes.c_uint),
+        ("dot11Bssid", ctypes.c_ubyte * 6),
+        ("dot11PhyType", ctypes.c_uint),
+        ("uDot11PhyIndex", ctypes.c_ulong),
+        ("wlanSignalQuality", ctypes.c_ulong),
+        ("ulRxRate", ctypes.c_ulong),
+        ("ulTxRate", ctypes.c_ulong),
+    ]
+
+
+class _WLAN_SECURITY_ATTRIBUTES(Structure):
+    _fields_ = [
+        ("bSecurityEnabled", ctypes.c_int),
+        ("bOneXEnabled", ctypes.c_int),
+        ("dot11AuthAlgorithm", ctypes.c_uint),
+        ("dot11CipherAlgorithm", ctypes.c_uint),
+    ]
+
+
+class _WLAN_CONNECTION_ATTRIBUTES(Structure):
+    _fields_ = [
+        ("isState", ctypes.c_uint),
+        ("wlanConnectionMode", ctypes.c_uint),
+        ("strProfileName", ctypes.c_wchar * _WLAN_MAX_NAME_LENGTH),
+        ("wlanAssociationAttributes", _WLAN_ASSOCIATION_ATTRIBUTES),
+        ("wlanSecurityAttributes", _WLAN_SECURITY_ATTRIBUTES),
+    ]
+
+
+# wlanapi.dll 句柄，首次使用时加载；加载失败后不再重试
+_wlanapi: ctypes.WinDLL | None = None
+_load_failed = False
+
+
+def _load_wlanapi():
+    """加载 wlanapi.dll，非 Windows 或加载失败返回 None"""
+    global _wlanapi, _load_failed
+    if _wlanapi is not None:
+        return _wlanapi
+    if _load_failed or not sys.platform.startswith("win"):
+        return None
+    try:
+        _wlanapi = ctypes.WinDLL("wlanapi.dll")
+    except OSError as e:
+        logger.warning(f"wlanapi.dll 加载失败，回退到 netsh: {e}")
+        _load_failed = True
+        return None
+    return _wlanapi
+
+
+class _WlanSession:
+    """WlanOpenHandle 会话，负责句柄与内存的释放"""
+
+    def __init__(self, api):
+        self._api = api
+        self._handle = ctypes.c_void_p()
+        negotiated = ctypes.c_ulong()
+        result = api.WlanOpenHandle(
+            ctypes.c_ulong(_WLAN_CLIENT_VERSION),
+            None,
+            byref(negotiated),
+            byref(self._handle),
+        )
+        if result != _ERROR_SUCCESS:
+            raise OSError(f"WlanOpenHandle 失败: {result}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._api.WlanCloseHandle(self._handle, None)
+        return False
+
+    def first_interface(self) -> _WLAN_INTERFACE_INFO | None:
+        """返回第一个无线接口的信息，没有无线接口时返回 None"""
+        interface_list = POINTER(_WLAN_INTERFACE_INFO_LIST)()
+        result = self._api.WlanEnumInterfaces(
+            self._handle, None, byref(interface_list)
+        )
+        if result != _ERROR_SUCCESS:
+            raise OSError(f"WlanEnumInterfaces 失败: {result}")
+        try:
+            if interface_list.contents.dwNumberOfItems == 0:
+                return None
+            # 只取第一个接口，拷贝一份以便释放列表内存
+            info = _WLAN_INTERFACE_INFO()
+            ctypes.memmove(
+                byref(info),
+                byref(interface_list.contents.InterfaceInfo[0]),
+                ctypes.sizeof(_WLAN_INTERFACE_INFO),
+            )
+            return info
+        finally:
+            self._api.WlanFreeMemory(interface_list)
+
+    def profile_names(self, interface_guid: _GUID) -> list[str]:
+        """返回指定接口上已保存的配置文件名称列表"""
+        profile_list = POINTER(_WLAN_PROFILE_INFO_LIST)()
+        result = self._api.WlanGetProfileList(
+            self._handle, byref(interface_guid), None, byref(profile_list)
+        )
+        if result != _ERROR_SUCCESS:
+            raise OSError(f"WlanGetProfileList 失败: {result}")
+        try:
+            count = profile_list.contents.dwNumberOfItems
+            profiles = ctypes.cast(
+                profile_list.contents.ProfileInfo,
+                POINTER(_WLAN_PROFILE_INFO * count),
+            ).contents
+            return [p.strProfileName for p in profiles]
+        finally:
+            self._api.WlanFreeMemory(profile_list)
+
+    def current_connection(
+        self, interface_guid: _GUID
+    ) -> _WLAN_CONNECTION_ATTRIBUTES | None:
+        """返回指定接口的当前连接属性，未连接时返回 None"""
+        data_size = ctypes.c_ulong()
+        data = ctypes.c_void_p()
+        result = self._api.WlanQueryInterface(
+            self._handle,
+            byref(interface_guid),
+            _WLAN_INTF_OPCODE_CURRENT_CONNECTION,
+            None,
+            byref(data_size),
+            byref(data),
+            None,
+        )
+        if result != _ERROR_SUCCESS:
+            # 未连接时该查询返回错误码，属正常情况
+            return None
+        try:
+            attributes = _WLAN_CONNECTION_ATTRIBUTES()
+            ctypes.memmove(
+                byref(attributes),
+                data,
+                min(data_size.value, ctypes.sizeof(attributes)),
+            )
+            return attributes
+        finally:
+            self._api.WlanFreeMemory(data)
+
+
+def list_profile_names() -> list[str] | None:
+    """通过 WLAN API 获取已保存的配置文件名称列表
+
+    Returns:
+        配置文件名称列表；API 不可用或调用失败返回 None
+    """
+    api = _load_wlanapi()
+    if api is None:
+        return None
+    try:
+        with _WlanSession(api) as session:
+            interface = session.first_interface()
+            if interface is None:
+                return []
+            return session.profile_names(interface.InterfaceGuid)
+    except OSError as e:
+        logger.warning(f"WLAN API 查询配置文件失败，回退到 netsh: {e}")
+        return None
+
+
+def get_interface_status() -> (
+    tuple[str | None, str | None, str | None, str | None] | None
+):
+    """通过 WLAN API 获取第一个无线接口的状态
+
+    Returns:
+        (接口名称, 状态, SSID, 配置文件名称)；API 不可用或调用失败返回 None
+    """
+    api = _load_wlanapi()
+    if api is None:
+        return None
+    try:
+        with _WlanSession(api) as session:
+            interface = session.first_interface()
+            if interface is None:
+                return (None, None, None, None)
+            name = interface.strInterfaceDescription
+            if interface.isState != _WLAN_INTERFACE_STATE_CONNECTED:
+                return (name, "disconnected", None, None)
+            connection = session.current_connection(interface.InterfaceGuid)
+            if connection is None:
+                return (name, "disconnected", None, None)
+            ssid_raw = connection.wlanAssociationAttributes.dot11Ssid
+            ssid = ssid_raw.ucSSID[: ssid_raw.uSSIDLength].decode(
+                "utf-8", errors="replace"
+            )
+            return (name, "connected", ssid or None, connection.strProfileName)
+    except OSError as e:
+        logger.warning(f"WLAN API 查询接口状态失败，回退到 netsh: {e}")
+        return None
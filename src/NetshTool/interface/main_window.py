@@ -3,10 +3,26 @@
 WiFi 管理工具的主界面。
 """
 
+import html
 import logging
+import time
+from collections import deque
+from functools import lru_cache
 from logging import Handler
 
-from PySide6.QtCore import Qt, Slot
+import shiboken6
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QMetaObject,
+    QModelIndex,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    Signal,
+    Slot,
+)
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -14,12 +30,10 @@ from PySide6.QtWidgets import (
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
-    QListWidgetItem,
+    QListView,
     QMainWindow,
-    QMessageBox,
+    QPlainTextEdit,
     QPushButton,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
@@ -28,62 +42,274 @@ from ..application.wifi_service import WiFiService
 
 logger = logging.getLogger(__name__)
 
+# 相同日志文本常重复出现（轮询、重试），转义结果做有界缓存直接复用
+_escape_html = lru_cache(maxsize=256)(html.escape)
 
-class QtLogHandler(Handler):
-    """Qt 日志处理器，将日志输出到 QTextEdit"""
 
-    def __init__(self, text_widget: QTextEdit):
+class QtLogHandler(Handler):
+    """Qt 日志处理器，将日志输出到 QPlainTextEdit"""
+
+    # 本类新增属性走槽描述符查找；基类 Handler 未定义 __slots__，
+    # 实例仍带 __dict__，收益限于自有字段的属性访问
+    __slots__ = (
+        "text_widget",
+        "_buffer",
+        "_flush_timer",
+        "_last_sec",
+        "_last_prefix",
+    )
+
+    # 各级别对应的颜色（十六进制），类常量避免逐条记录构造 QColor
+    ERROR_COLOR = "#dc3545"  # 红色
+    WARNING_COLOR = "#ffc107"  # 黄色
+    INFO_COLOR = "#28a745"  # 绿色
+
+    # 级别到颜色的查表（级别先归整到 10 的倍数），取代逐级 if/elif 比较
+    _COLOR_BY_LEVEL = {
+        logging.CRITICAL: ERROR_COLOR,
+        logging.ERROR: ERROR_COLOR,
+        logging.WARNING: WARNING_COLOR,
+    }
+
+    # 日志批量刷新间隔（毫秒），突发日志在一个周期内合并为一次控件写入
+    FLUSH_INTERVAL_MS = 100
+
+    # 待刷新缓冲的最大条数，与控件的最大块数一致，窗口长期隐藏时内存有界
+    BUFFER_MAXLEN = 5000
+
+    # 仅用于异常堆栈的格式化，常规记录由重写的 format 直接拼装
+    _EXC_FORMATTER = logging.Formatter()
+
+    def __init__(self, text_widget: QPlainTextEdit):
         super().__init__()
         self.text_widget = text_widget
-        self.setFormatter(
-            logging.Formatter("[%(asctime)s] %(message)s", datefmt="%H:%M:%S")
-        )
+        self._buffer: deque[tuple[str, str]] = deque(maxlen=self.BUFFER_MAXLEN)
+        self._flush_timer = QTimer(text_widget)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(self.FLUSH_INTERVAL_MS)
+        self._flush_timer.timeout.connect(self._flush)
+        # 时间戳前缀按秒缓存，同一秒内的记录不重复 strftime
+        self._last_sec = -1
+        self._last_prefix = ""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """直接拼装日志行，跳过 Formatter.format 的通用替换路径"""
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_prefix = time.strftime("%H:%M:%S", time.localtime(sec))
+            self._last_sec = sec
+        msg = f"[{self._last_prefix}] {record.getMessage()}"
+        if record.exc_info:
+            if not record.exc_text:
+                record.exc_text = self._EXC_FORMATTER.formatException(
+                    record.exc_info
+                )
+            msg = f"{msg}\n{record.exc_text}"
+        return msg
 
     def emit(self, record: logging.LogRecord):
-        """输出日志记录"""
+        """输出日志记录（只入队，由定时器批量刷新到控件）"""
+        # 控件的 C++ 对象已销毁时直接丢弃，避免逐条走异常分发路径
+        if not shiboken6.isValid(self.text_widget):
+            return
         try:
             msg = self.format(record)
-            # 根据日志级别设置颜色
-            if record.levelno >= logging.ERROR:
-                color = QColor("#dc3545")  # 红色
-            elif record.levelno >= logging.WARNING:
-                color = QColor("#ffc107")  # 黄色
-            else:
-                color = QColor("#28a745")  # 绿色
-
-            self.text_widget.setTextColor(color)
-            self.text_widget.append(msg)
+            # 根据日志级别查表取色
+            color = self._COLOR_BY_LEVEL.get(
+                record.levelno // 10 * 10, self.INFO_COLOR
+            )
+
+            self._buffer.append((color, msg))
+            # 日志可能来自线程池工作线程，经队列连接在界面线程启动定时器
+            if not self._flush_timer.isActive():
+                QMetaObject.invokeMethod(
+                    self._flush_timer,
+                    "start",
+                    Qt.ConnectionType.QueuedConnection,
+                )
         except Exception:
             self.handleError(record)
 
+    def _flush(self):
+        """把缓冲的日志写入控件
+
+        相邻的同色记录合并为一段 HTML，一个刷新周期内
+        无论积压多少条日志，控件只做少量排版。
+        """
+        buffer = self._buffer
+        if not buffer:
+            return
+        if not shiboken6.isValid(self.text_widget):
+            buffer.clear()
+            return
+        # 控件不可见（窗口最小化等）时不做排版，日志留在缓冲中待补放
+        if not self.text_widget.isVisible():
+            return
+        group_color: str | None = None
+        group_lines: list[str] = []
+        while buffer:
+            color, msg = buffer.popleft()
+            if color != group_color and group_lines:
+                self._append_group(group_color, group_lines)
+                group_lines = []
+            group_color = color
+            # 消息内部的换行（如异常堆栈）也要转成 <br>，HTML 会折叠普通换行
+            group_lines.append(_escape_html(msg).replace("\n", "<br>"))
+        if group_lines:
+            self._append_group(group_color, group_lines)
+
+    def _append_group(self, color: str, lines: list[str]):
+        """以单次 appendHtml 写入一组同色日志行"""
+        self.text_widget.appendHtml(
+            f'<span style="color:{color}">' + "<br>".join(lines) + "</span>"
+        )
+
+    def flush_pending(self):
+        """调度一次刷新，供窗口重新可见时补放积压的日志"""
+        if self._buffer and not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+
+class NetworkListModel(QAbstractListModel):
+    """已保存网络列表的数据模型
+
+    只读的字符串列表用模型驱动的 QListView 承载，
+    刷新时一次模型重置即可替换全部数据，无需逐项构造条目对象。
+    """
+
+    # 已连接网络的前景色
+    _CONNECTED_FOREGROUND = QColor("#28a745")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._networks: list[str] = []
+        self._connected_row = -1
+
+    def rowCount(self, parent=QModelIndex()) -> int:  # noqa: N802  Qt 重写要求驼峰命名
+        if parent.isValid():
+            return 0
+        return len(self._networks)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._networks)):
+            return None
+        row = index.row()
+        name = self._networks[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            if row == self._connected_row:
+                return f"{name}（已连接）"
+            return name
+        if role == Qt.ItemDataRole.UserRole:
+            return name
+        if role == Qt.ItemDataRole.ForegroundRole and row == self._connected_row:
+            return self._CONNECTED_FOREGROUND
+        return None
+
+    def set_networks(self, networks: list[str], connected_network: str | None):
+        """整体替换列表数据
+
+        Args:
+            networks: WiFi 网络名称列表
+            connected_network: 当前连接的网络名称
+        """
+        self.beginResetModel()
+        self._networks = list(networks)
+        try:
+            self._connected_row = (
+                -1
+                if connected_network is None
+                else self._networks.index(connected_network)
+            )
+        except ValueError:
+            self._connected_row = -1
+        self.endResetModel()
+
+
+class WorkerSignals(QObject):
+    """后台任务的信号集合
+
+    QRunnable 本身不是 QObject，信号挂在独立对象上。
+    finished 的参数为 (是否正常执行完毕, 任务返回值或异常消息)。
+    """
+
+    finished = Signal(bool, object)
+
+
+class WifiWorker(QRunnable):
+    """在线程池中执行 WiFiService 调用的工作单元
+
+    实例可复用：setAutoDelete(False) 让线程池不回收对象，
+    主窗口用空闲列表缓存，重置后再次提交，避免每次点击都
+    构造一对 QRunnable/QObject。
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = WorkerSignals()
+        self._fn = None
+        self._args = ()
+
+    def reset(self, fn, *args):
+        """复用前重置要执行的调用"""
+        self._fn = fn
+        self._args = args
+
+    def run(self):
+        """执行任务并通过信号回传结果"""
+        try:
+            result = self._fn(*self._args)
+        except Exception as e:
+            logger.error(f"后台任务执行异常: {e}", exc_info=True)
+            self.signals.finished.emit(False, str(e))
+            return
+        self.signals.finished.emit(True, result)
+
 
 class MainWindow(QMainWindow):
     """主窗口类"""
 
+    # 空闲工作对象列表的上限
+    _WORKER_POOL_MAXSIZE = 8
+
     def __init__(self):
         """初始化主窗口"""
         super().__init__()
         self._wifi_service = WiFiService()
+        # 空闲的后台工作对象，复用以减少 QObject 构造
+        self._worker_pool: list[WifiWorker] = []
         self._init_ui()
         self._setup_log_handler()
-        self._refresh_networks()
+        # 首次刷新推迟到事件循环空闲时执行，先让窗口完成首帧绘制
+        QTimer.singleShot(0, self._refresh_networks)
 
-    @staticmethod
-    def _get_network_name_from_item(item: QListWidgetItem) -> str:
-        name = item.data(Qt.ItemDataRole.UserRole)
-        if isinstance(name, str) and name:
-            return name
-        return item.text()
+    def _selected_network_names(self) -> list[str]:
+        """获取当前选中的网络名称列表（无选中时返回空列表）"""
+        indexes = self._network_list.selectionModel().selectedIndexes()
+        return [index.data(Qt.ItemDataRole.UserRole) for index in indexes]
 
     def _setup_log_handler(self):
         """设置日志处理器"""
         # 获取根日志器
         root_logger = logging.getLogger()
         # 创建 Qt 日志处理器
-        qt_handler = QtLogHandler(self._log_output)
-        qt_handler.setLevel(logging.INFO)
+        self._qt_log_handler = QtLogHandler(self._log_output)
+        self._qt_log_handler.setLevel(logging.INFO)
         # 添加到日志器
-        root_logger.addHandler(qt_handler)
+        root_logger.addHandler(self._qt_log_handler)
+
+    def showEvent(self, event):  # noqa: N802  Qt 重写要求驼峰命名
+        """窗口重新可见时补放隐藏期间积压的日志"""
+        super().showEvent(event)
+        self._qt_log_handler.flush_pending()
+
+    def closeEvent(self, event):  # noqa: N802  Qt 重写要求驼峰命名
+        """关闭窗口时从根日志器摘除 Qt 处理器
+
+        否则窗口销毁后日志仍会发往已删除的控件。
+        """
+        logging.getLogger().removeHandler(self._qt_log_handler)
+        super().closeEvent(event)
 
     def _init_ui(self):
         """初始化用户界面"""
@@ -97,9 +323,18 @@ class MainWindow(QMainWindow):
         # 主布局
         main_layout = QVBoxLayout(central_widget)
 
-        # 已保存网络列表
+        # 已保存网络列表（模型驱动的只读视图）
         main_layout.addWidget(QLabel("已保存的网络:"))
-        self._network_list = QListWidget()
+        self._network_model = NetworkListModel(self)
+        self._network_list = QListView()
+        self._network_list.setModel(self._network_model)
+        self._network_list.setEditTriggers(
+            QListView.EditTrigger.NoEditTriggers
+        )
+        # 支持多选，导出/删除按选中批量执行
+        self._network_list.setSelectionMode(
+            QListView.SelectionMode.ExtendedSelection
+        )
         main_layout.addWidget(self._network_list)
 
         # 操作按钮区域（刷新列表、导出选中、删除选中、删除全部）
@@ -161,8 +396,10 @@ class MainWindow(QMainWindow):
         # 日志输出区域
         log_group = QGroupBox("操作日志")
         log_layout = QVBoxLayout()
-        self._log_output = QTextEdit()
+        self._log_output = QPlainTextEdit()
         self._log_output.setReadOnly(True)
+        # 限制最大块数，旧日志按环形缓冲淘汰，避免文档无限增长拖慢排版
+        self._log_output.setMaximumBlockCount(5000)
         self._log_output.setPlaceholderText("程序运行日志将在此显示...")
         log_layout.addWidget(self._log_output)
         log_group.setLayout(log_layout)
@@ -171,31 +408,54 @@ class MainWindow(QMainWindow):
         # 状态栏
         self.statusBar().showMessage("就绪")
 
+    def _run_in_background(self, button: QPushButton, on_done, fn, *args):
+        """把 WiFiService 调用提交到线程池执行
+
+        netsh 调用可能阻塞数百毫秒，放到后台线程避免冻结界面；
+        完成前禁用触发按钮防止重复提交，结果经信号回到界面线程处理。
+
+        Args:
+            button: 触发本次操作的按钮
+            on_done: 界面线程的结果回调，签名为 (ok, result)
+            fn: 要在后台执行的可调用对象
+            *args: 传给 fn 的参数
+        """
+        button.setEnabled(False)
+        worker = self._worker_pool.pop() if self._worker_pool else WifiWorker()
+        worker.reset(fn, *args)
+
+        def handle(ok: bool, result: object):
+            worker.signals.finished.disconnect(handle)
+            if len(self._worker_pool) < self._WORKER_POOL_MAXSIZE:
+                self._worker_pool.append(worker)
+            button.setEnabled(True)
+            on_done(ok, result)
+
+        worker.signals.finished.connect(handle)
+        QThreadPool.globalInstance().start(worker)
+
     @Slot()
     def _refresh_networks(self):
         """刷新网络列表"""
-        try:
-            success, networks = self._wifi_service.get_saved_networks()
-            if success:
-                connected_network = self._wifi_service.get_connected_network()
-                self._network_list.clear()
-                for network in networks:
-                    item = QListWidgetItem()
-                    item.setData(Qt.ItemDataRole.UserRole, network)
-                    display_text = network
-                    if connected_network is not None and network == connected_network:
-                        display_text = f"{network}（已连接）"
-                        item.setForeground(QColor("#28a745"))
-                    item.setText(display_text)
-                    self._network_list.addItem(item)
-                self.statusBar().showMessage(
-                    f"已更新网络列表，共 {len(networks)} 个网络"
-                )
-            else:
-                self._show_error_message("刷新失败", "无法获取已保存的网络列表")
-        except Exception as e:
-            logger.error(f"刷新网络列表异常: {e}", exc_info=True)
-            self._show_error_message("刷新异常", f"刷新网络列表时发生异常: {e}")
+        self._run_in_background(
+            self._refresh_btn,
+            self._on_refresh_done,
+            self._wifi_service.get_networks_overview,
+        )
+
+    def _on_refresh_done(self, ok: bool, result: object):
+        """刷新完成后更新网络列表"""
+        if not ok:
+            self._show_error_message("刷新异常", f"刷新网络列表时发生异常: {result}")
+            return
+        success, networks, connected_network = result
+        if not success:
+            self._show_error_message("刷新失败", "无法获取已保存的网络列表")
+            return
+
+        # 一次模型重置替换全部数据，视图只做一次布局刷新
+        self._network_model.set_networks(networks, connected_network)
+        self.statusBar().showMessage(f"已更新网络列表，共 {len(networks)} 个网络")
 
     @Slot()
     def _add_wifi(self):
@@ -212,74 +472,102 @@ class MainWindow(QMainWindow):
             self._show_warning_message("输入错误", "WiFi 密码长度至少为 8 位")
             return
 
-        try:
-            success, message = self._wifi_service.add_wifi_network(
-                name, password, auto_connect
-            )
-            if success:
-                self._show_info_message("添加成功", message)
-                self._name_input.clear()
-                self._password_input.clear()
-                self._refresh_networks()
-            else:
-                self._show_error_message("添加失败", message)
-        except Exception as e:
-            logger.error(f"添加 WiFi 异常: {e}", exc_info=True)
-            self._show_error_message("添加异常", f"添加 WiFi 时发生异常: {e}")
+        self._run_in_background(
+            self._add_btn,
+            self._on_add_done,
+            self._wifi_service.add_wifi_network,
+            name,
+            password,
+            auto_connect,
+        )
+
+    def _on_add_done(self, ok: bool, result: object):
+        """添加完成后清空输入并刷新列表"""
+        if not ok:
+            self._show_error_message("添加异常", f"添加 WiFi 时发生异常: {result}")
+            return
+        success, message = result
+        if success:
+            self._show_info_message("添加成功", message)
+            self._name_input.clear()
+            self._password_input.clear()
+            self._refresh_networks()
+        else:
+            self._show_error_message("添加失败", message)
 
     @Slot()
     def _export_selected(self):
         """导出选中的 WiFi 网络"""
-        selected_items = self._network_list.selectedItems()
-        if not selected_items:
+        names = self._selected_network_names()
+        if not names:
             self._show_warning_message("选择错误", "请先选择要导出的 WiFi 网络")
             return
 
-        network_name = self._get_network_name_from_item(selected_items[0])
-
-        reply = self._show_question_message(
+        if len(names) == 1:
+            prompt = f'确定要导出 WiFi 网络 "{names[0]}" 吗？\n配置文件将保存到桌面。'
+        else:
+            prompt = (
+                f"确定要导出选中的 {len(names)} 个 WiFi 网络吗？\n"
+                "配置文件将保存到桌面。"
+            )
+        self._ask_confirmation(
             "确认导出",
-            f'确定要导出 WiFi 网络 "{network_name}" 吗？\n配置文件将保存到桌面。',
+            prompt,
+            lambda: self._run_in_background(
+                self._export_btn,
+                self._on_export_done,
+                self._wifi_service.export_wifi_networks,
+                names,
+            ),
         )
-        if reply != QMessageBox.StandardButton.Yes:
-            return
 
-        try:
-            success, message = self._wifi_service.export_wifi_network(network_name)
-            if success:
-                self._show_info_message("导出成功", message)
-            else:
-                self._show_error_message("导出失败", message)
-        except Exception as e:
-            logger.error(f"导出 WiFi 异常: {e}", exc_info=True)
-            self._show_error_message("导出异常", f"导出 WiFi 时发生异常: {e}")
+    def _on_export_done(self, ok: bool, result: object):
+        """导出完成后提示结果"""
+        if not ok:
+            self._show_error_message("导出异常", f"导出 WiFi 时发生异常: {result}")
+            return
+        success, message = result
+        if success:
+            self._show_info_message("导出成功", message)
+        else:
+            self._show_error_message("导出失败", message)
 
     @Slot()
     def _delete_selected(self):
         """删除选中的 WiFi 网络"""
-        selected_items = self._network_list.selectedItems()
-        if not selected_items:
+        names = self._selected_network_names()
+        if not names:
             self._show_warning_message("选择错误", "请先选择要删除的 WiFi 网络")
             return
 
-        network_name = self._get_network_name_from_item(selected_items[0])
-
-        reply = self._show_question_message(
-            "确认删除", f'确定要删除 WiFi 网络 "{network_name}" 吗？\n此操作不可撤销！'
+        if len(names) == 1:
+            prompt = f'确定要删除 WiFi 网络 "{names[0]}" 吗？\n此操作不可撤销！'
+        else:
+            prompt = (
+                f"确定要删除选中的 {len(names)} 个 WiFi 网络吗？\n此操作不可撤销！"
+            )
+        self._ask_confirmation(
+            "确认删除",
+            prompt,
+            lambda: self._run_in_background(
+                self._delete_btn,
+                self._on_delete_done,
+                self._wifi_service.delete_wifi_networks,
+                names,
+            ),
         )
-        if reply != QMessageBox.StandardButton.Yes:
-            return
 
-        try:
-            success, message = self._wifi_service.delete_wifi_network(network_name)
-            if success:
-                self._show_info_message("删除成功", message)
-                self._refresh_networks()
-            else:
-                self._show_error_message("删除失败", message)
-        except Exception as e:
-            logger.error(f"删除 WiFi 异常: {e}", exc_info=True)
-            self._show_error_message("删除异常", f"删除 WiFi 时发生异常: {e}")
+    def _on_delete_done(self, ok: bool, result: object):
+        """删除完成后刷新列表"""
+        if not ok:
+            self._show_error_message("删除异常", f"删除 WiFi 时发生异常: {result}")
+            return
+        success, message = result
+        if success:
+            self._show_info_message("删除成功", message)
+            self._refresh_networks()
+        else:
+            self._show_error_message("删除失败", message)
 
     @Slot()
     def _delete_all(self):
@@ -289,26 +577,32 @@ class MainWindow(QMainWindow):
             "此操作不可撤销！\n\n"
             "请再次确认是否继续？"
         )
-        reply = self._show_question_message(
+        self._ask_confirmation(
             "危险操作",
             message,
+            lambda: self._run_in_background(
+                self._delete_all_btn,
+                self._on_delete_all_done,
+                self._wifi_service.delete_all_networks,
+            ),
         )
-        if reply != QMessageBox.StandardButton.Yes:
-            return
 
-        try:
-            success, message = self._wifi_service.delete_all_networks()
-            if success:
-                self._show_info_message("删除成功", message)
-                self._refresh_networks()
-            else:
-                self._show_error_message("删除失败", message)
-        except Exception as e:
-            logger.error(f"删除所有 WiFi 异常: {e}", exc_info=True)
-            self._show_error_message("删除异常", f"删除所有 WiFi 时发生异常: {e}")
+    def _on_delete_all_done(self, ok: bool, result: object):
+        """删除全部完成后刷新列表"""
+        if not ok:
+            self._show_error_message("删除异常", f"删除所有 WiFi 时发生异常: {result}")
+            return
+        success, message = result
+        if success:
+            self._show_info_message("删除成功", message)
+            self._refresh_networks()
+        else:
+            self._show_error_message("删除失败", message)
 
     def _show_info_message(self, title: str, message: str):
         """显示信息对话框"""
+        from PySide6.QtWidgets import QMessageBox
+
         QMessageBox.information(
             self,
             title,
@@ -319,6 +613,8 @@ class MainWindow(QMainWindow):
 
     def _show_warning_message(self, title: str, message: str):
         """显示警告对话框"""
+        from PySide6.QtWidgets import QMessageBox
+
         QMessageBox.warning(
             self,
             title,
@@ -329,6 +625,8 @@ class MainWindow(QMainWindow):
 
     def _show_error_message(self, title: str, message: str):
         """显示错误对话框"""
+        from PySide6.QtWidgets import QMessageBox
+
         QMessageBox.critical(
             self,
             title,
@@ -337,14 +635,32 @@ class MainWindow(QMainWindow):
             QMessageBox.StandardButton.Ok,
         )
 
-    def _show_question_message(
-        self, title: str, message: str
-    ) -> QMessageBox.StandardButton:
-        """显示确认对话框"""
-        return QMessageBox.question(
-            self,
+    def _ask_confirmation(self, title: str, message: str, on_yes):
+        """显示非阻塞的确认对话框
+
+        使用 open() 而非 exec()，不嵌套模态事件循环，
+        对话框弹出期间日志批量刷新等定时任务照常运行。
+
+        Args:
+            title: 对话框标题
+            message: 确认内容
+            on_yes: 用户确认后执行的回调
+        """
+        from PySide6.QtWidgets import QMessageBox
+
+        box = QMessageBox(
+            QMessageBox.Icon.Question,
             title,
             message,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
+            self,
         )
+        box.setDefaultButton(QMessageBox.StandardButton.No)
+        box.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+
+        def handle(result: int):
+            if result == QMessageBox.StandardButton.Yes:
+                on_yes()
+
+        box.finished.connect(handle)
+        box.open()
@@ -25,27 +25,14 @@ else:
     if str(project_root) not in sys.path:
         sys.path.insert(0, str(project_root))
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import QTimer
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import QApplication
 
-from NetshTool.infrastructure.paths import get_project_root
-from NetshTool.interface.main_window import MainWindow
+from NetshTool.infrastructure.paths import get_icon_path
 
-
-def get_icon_path() -> Path:
-    """获取图标文件路径"""
-    # PyInstaller 打包后的路径
-    if getattr(sys, "frozen", False):
-        if hasattr(sys, "_MEIPASS"):
-            base_path = Path(sys._MEIPASS)
-        else:
-            base_path = Path(sys.executable).parent
-        return base_path / "NetshTool" / "image" / "icon.ico"
-    else:
-        # 开发环境
-        project_root = get_project_root()
-        return project_root / "src" / "NetshTool" / "image" / "icon.ico"
+# 图标路径在导入时计算一次（纯路径拼接，无 I/O），启动时直接复用
+_ICON_PATH = get_icon_path()
 
 
 def setup_logging():
@@ -74,25 +61,27 @@ def main():
         app.setApplicationName("NetshTool")
         app.setOrganizationName("NetshTool")
 
-        # 启用高分屏支持
-        app.setAttribute(Qt.ApplicationAttribute.AA_EnableHighDpiScaling)
-        app.setAttribute(Qt.ApplicationAttribute.AA_UseHighDpiPixmaps)
-
-        # 设置应用图标
-        icon_path = get_icon_path()
-        logging.info(f"图标路径: {icon_path}")
-        logging.info(f"图标存在: {icon_path.exists()}")
-        if icon_path.exists():
-            icon = QIcon(str(icon_path))
-            app.setWindowIcon(icon)
-            logging.info("应用图标已设置")
-        else:
-            logging.warning("图标文件不存在")
+        # 主窗口模块延迟到 QApplication 就绪后导入，缩短启动时的导入链
+        from NetshTool.interface.main_window import MainWindow
 
         # 创建并显示主窗口
         window = MainWindow()
         window.show()
 
+        # 设置应用图标（exists 只做一次 stat，诊断信息降为 DEBUG）
+        # ICO 多分辨率解码移出首帧关键路径，窗口显示后由事件循环补设
+        icon_path = _ICON_PATH
+        icon_exists = icon_path.exists()
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug(f"图标路径: {icon_path}")
+            logging.debug(f"图标存在: {icon_exists}")
+        if icon_exists:
+            QTimer.singleShot(
+                0, lambda: app.setWindowIcon(QIcon(str(icon_path)))
+            )
+        else:
+            logging.warning("图标文件不存在")
+
         sys.exit(app.exec())
 
     except Exception as e:
@@ -0,0 +1,55 @@
+"""测试 WiFi 管理服务"""
+
+from src.NetshTool.application.wifi_service import WiFiService
+
+
+class _FakeExecutor:
+    """可编程的执行器替身，记录 show_profiles 调用次数"""
+
+    def __init__(self, results):
+        self.calls = 0
+        self._results = list(results)
+
+    def show_profiles(self):
+        self.calls += 1
+        if len(self._results) > 1:
+            return self._results.pop(0)
+        return self._results[0]
+
+
+class TestWiFiServiceProfilesCache:
+    """已保存网络列表缓存测试"""
+
+    @staticmethod
+    def _service_with(executor):
+        service = WiFiService()
+        service._executor = executor
+        return service
+
+    def test_success_result_cached_within_ttl(self):
+        """测试成功结果在有效期内复用缓存"""
+        executor = _FakeExecutor([(True, ["WifiA", "WifiB"])])
+        service = self._service_with(executor)
+
+        assert service.get_saved_networks() == (True, ["WifiA", "WifiB"])
+        assert service.get_saved_networks() == (True, ["WifiA", "WifiB"])
+        assert executor.calls == 1
+
+    def test_failure_result_not_cached(self):
+        """测试失败结果不进缓存，重试立即重新查询"""
+        executor = _FakeExecutor([(False, []), (True, ["WifiA"])])
+        service = self._service_with(executor)
+
+        assert service.get_saved_networks() == (False, [])
+        assert service.get_saved_networks() == (True, ["WifiA"])
+        assert executor.calls == 2
+
+    def test_invalidation_forces_refetch(self):
+        """测试缓存失效后重新查询"""
+        executor = _FakeExecutor([(True, ["WifiA"])])
+        service = self._service_with(executor)
+
+        service.get_saved_networks()
+        service._invalidate_profiles_cache()
+        service.get_saved_networks()
+        assert executor.calls == 2
@@ -0,0 +1,25 @@
+"""测试 WiFi 网络列表实体"""
+
+from src.NetshTool.domain.network_list import WiFiNetworkList
+
+
+class TestWiFiNetworkList:
+    """WiFi 网络列表实体测试"""
+
+    def test_contains_uses_index(self):
+        """测试成员判断"""
+        network_list = WiFiNetworkList(profiles=["家里WiFi", "OfficeWifi"])
+        assert network_list.contains("家里WiFi") is True
+        assert network_list.contains("OfficeWifi") is True
+        assert network_list.contains("Unknown") is False
+
+    def test_is_empty(self):
+        """测试空列表判断"""
+        assert WiFiNetworkList(profiles=[]).is_empty() is True
+        assert WiFiNetworkList(profiles=["WifiA"]).is_empty() is False
+
+    def test_profiles_order_preserved(self):
+        """测试显示顺序不受索引影响"""
+        profiles = ["WifiB", "WifiA", "WifiC"]
+        network_list = WiFiNetworkList(profiles=profiles)
+        assert network_list.profiles == profiles
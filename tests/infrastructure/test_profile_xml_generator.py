@@ -1,9 +1,30 @@
 """测试 XML 生成器"""
+import sys
+import time
 
 from src.NetshTool.domain.profile import ConnectionMode, WiFiProfile
-from src.NetshTool.infrastructure.netsh_executor import NetshExecutor
+from src.NetshTool.infrastructure import wlan_api
+from src.NetshTool.infrastructure.netsh_executor import (
+    _BATCH_SENTINEL,
+    NetshExecutor,
+    _CachedResult,
+)
 from src.NetshTool.infrastructure.profile_xml_generator import ProfileXmlGenerator
 
+_INTERFACES_OUTPUT = """
+    Name                   : Wi-Fi
+    State                  : connected
+    SSID                   : MyWifi
+    Profile                : MyWifi
+""".strip()
+
+_PROFILES_OUTPUT = (
+    "Profiles on interface Wi-Fi:\n"
+    "\n"
+    "    All User Profile     : WifiA\n"
+    "    All User Profile     : WifiB\n"
+)
+
 
 class TestProfileXmlGenerator:
     """XML 生成器测试"""
@@ -112,3 +133,126 @@ class TestNetshExecutor:
         assert status.ssid == "MyWifi"
         assert status.profile == "MyWifi"
         assert NetshExecutor._is_connected_state(status.state) is True
+
+    def test_parse_profiles_cn_and_en(self):
+        """测试中英文 show profiles 输出的配置文件提取"""
+        cn_output = (
+            "接口 Wi-Fi 上的配置文件:\n"
+            "\n"
+            "    所有用户配置文件 : 家里WiFi\n"
+            "    所有用户配置文件 : 公司WiFi\n"
+        )
+        assert NetshExecutor._parse_profiles(cn_output) == ["家里WiFi", "公司WiFi"]
+        assert NetshExecutor._parse_profiles(_PROFILES_OUTPUT) == ["WifiA", "WifiB"]
+
+    def test_batch_output_split_on_sentinel(self, monkeypatch):
+        """测试批量查询输出按哨兵行切分"""
+        executor = NetshExecutor()
+        monkeypatch.setattr(wlan_api, "get_interface_status", lambda: None)
+        monkeypatch.setattr(wlan_api, "list_profile_names", lambda: None)
+        monkeypatch.setattr(sys, "platform", "win32")
+        batch_output = (
+            f"{_INTERFACES_OUTPUT}\n{_BATCH_SENTINEL}\n{_PROFILES_OUTPUT}"
+        )
+        monkeypatch.setattr(
+            executor, "_run_command", lambda command: (True, batch_output)
+        )
+
+        status, success, profiles = executor.show_interfaces_and_profiles()
+
+        assert success is True
+        assert profiles == ["WifiA", "WifiB"]
+        assert status.ssid == "MyWifi"
+        assert status.profile == "MyWifi"
+
+    def test_batch_fallback_without_sentinel(self, monkeypatch):
+        """测试哨兵行缺失时回退到两次独立查询"""
+        executor = NetshExecutor()
+        monkeypatch.setattr(wlan_api, "get_interface_status", lambda: None)
+        monkeypatch.setattr(wlan_api, "list_profile_names", lambda: None)
+        monkeypatch.setattr(sys, "platform", "win32")
+
+        def fake_run(command):
+            if command[0] == "cmd":
+                # 批量输出异常，不含哨兵行
+                return True, "garbled output"
+            if command[-1] == "interfaces":
+                return True, _INTERFACES_OUTPUT
+            return True, _PROFILES_OUTPUT
+
+        monkeypatch.setattr(executor, "_run_command", fake_run)
+
+        status, success, profiles = executor.show_interfaces_and_profiles()
+
+        assert success is True
+        assert profiles == ["WifiA", "WifiB"]
+        assert status.ssid == "MyWifi"
+
+    def test_is_query_command_checks_subcommand_position(self):
+        """测试查询判定只看子命令位置，不受参数内容影响"""
+        assert NetshExecutor._is_query_command(
+            ["netsh", "wlan", "show", "profiles"]
+        ) is True
+        assert NetshExecutor._is_query_command(
+            ["netsh", "wlan", "show", "interfaces"]
+        ) is True
+        # 名称或路径中恰好包含 show 的写操作不应被当作查询缓存
+        assert NetshExecutor._is_query_command(
+            ["netsh", "wlan", "delete", "profile", "name=roadshow"]
+        ) is False
+        assert NetshExecutor._is_query_command(
+            ["netsh", "wlan", "add", "profile", "filename=C:\\tmp\\show.xml"]
+        ) is False
+        assert NetshExecutor._is_query_command(
+            ["netsh", "wlan", "export", "profile", "name=x", "folder=C:\\show"]
+        ) is False
+        # cmd 批量查询串
+        assert NetshExecutor._is_query_command(
+            ["cmd", "/d", "/c", "netsh wlan show interfaces & echo X"]
+        ) is True
+
+    def test_query_cache_hit_and_invalidation(self):
+        """测试查询缓存命中与失效"""
+        executor = NetshExecutor()
+        command = ["netsh", "wlan", "show", "profiles"]
+        executor._query_cache[tuple(command)] = _CachedResult(
+            time.monotonic(), True, "cached-output"
+        )
+
+        # 有效期内直接返回缓存结果，不再执行子进程
+        assert executor._run_command(command) == (True, "cached-output")
+
+        executor._invalidate_query_cache()
+        assert executor._query_cache == {}
+
+    def test_export_profiles_returns_ordered_results(self, monkeypatch):
+        """测试批量导出按入参顺序返回各自结果"""
+        executor = NetshExecutor()
+
+        def fake_export(name, output_path):
+            assert output_path == "out"
+            return (name != "Bad", name)
+
+        monkeypatch.setattr(executor, "export_profile", fake_export)
+
+        results = executor.export_profiles(["A", "Bad", "C"], "out")
+
+        assert results == [(True, "A"), (False, "Bad"), (True, "C")]
+
+    def test_delete_profiles_returns_ordered_results(self, monkeypatch):
+        """测试批量删除按入参顺序返回各自结果"""
+        executor = NetshExecutor()
+        monkeypatch.setattr(
+            executor, "delete_profile", lambda name: (name != "Bad", name)
+        )
+
+        results = executor.delete_profiles(["A", "Bad", "C"])
+
+        assert results == [(True, "A"), (False, "Bad"), (True, "C")]
+
+    def test_bulk_methods_with_empty_list(self):
+        """测试批量方法对空列表直接返回，不创建线程池"""
+        executor = NetshExecutor()
+
+        assert executor.export_profiles([], "out") == []
+        assert executor.delete_profiles([]) == []
@@ -0,0 +1,97 @@
+"""测试 XML 解析器"""
+
+from src.NetshTool.domain.profile import ConnectionMode, WiFiProfile
+from src.NetshTool.infrastructure.profile_xml_generator import ProfileXmlGenerator
+from src.NetshTool.infrastructure.profile_xml_parser import ProfileXmlParser
+
+
+class TestProfileXmlParser:
+    """XML 解析器测试"""
+
+    def test_round_trip_with_generator(self):
+        """测试生成器输出可完整解析回实体"""
+        generator = ProfileXmlGenerator()
+        parser = ProfileXmlParser()
+        profile = WiFiProfile(
+            name="测试<&>WiFi",
+            password='pass"word&123',
+            connection_mode=ConnectionMode.MANUAL,
+            auto_switch=True,
+            enable_randomization=False,
+        )
+
+        parsed = parser.parse_xml(generator.generate_xml(profile))
+
+        assert parsed is not None
+        assert parsed.name == profile.name
+        assert parsed.password == profile.password
+        assert parsed.connection_mode == ConnectionMode.MANUAL
+        assert parsed.auto_switch is True
+        assert parsed.enable_randomization is False
+
+    def test_profile_name_wins_over_ssid_name(self):
+        """测试 WLANProfile/name 优先于 SSID/name"""
+        xml_content = (
+            "<WLANProfile>"
+            "<name>ProfileName</name>"
+            "<SSIDConfig><SSID><name>SsidName</name></SSID></SSIDConfig>"
+            "<MSM><security><sharedKey>"
+            "<keyMaterial>password123</keyMaterial>"
+            "</sharedKey></security></MSM>"
+            "</WLANProfile>"
+        )
+        parsed = ProfileXmlParser().parse_xml(xml_content)
+        assert parsed is not None
+        assert parsed.name == "ProfileName"
+
+    def test_parse_with_default_namespace(self):
+        """测试带默认命名空间的文档（netsh 导出格式）"""
+        xml_content = (
+            '<WLANProfile xmlns="http://www.microsoft.com/networking/WLAN/'
+            'profile/v1">'
+            "<name>HomeWifi</name>"
+            "<connectionMode>manual</connectionMode>"
+            "<MSM><security><sharedKey>"
+            "<keyMaterial>password123</keyMaterial>"
+            "</sharedKey></security></MSM>"
+            "</WLANProfile>"
+        )
+        parsed = ProfileXmlParser().parse_xml(xml_content)
+        assert parsed is not None
+        assert parsed.name == "HomeWifi"
+        assert parsed.connection_mode == ConnectionMode.MANUAL
+
+    def test_unknown_connection_mode_defaults_to_auto(self):
+        """测试未知 connectionMode 回退到自动而非解析失败"""
+        xml_content = (
+            "<WLANProfile>"
+            "<name>HomeWifi</name>"
+            "<connectionMode>whenever</connectionMode>"
+            "<MSM><security><sharedKey>"
+            "<keyMaterial>password123</keyMaterial>"
+            "</sharedKey></security></MSM>"
+            "</WLANProfile>"
+        )
+        parsed = ProfileXmlParser().parse_xml(xml_content)
+        assert parsed is not None
+        assert parsed.connection_mode == ConnectionMode.AUTO
+
+    def test_missing_name_returns_none(self):
+        """测试缺少 name 元素时解析失败"""
+        xml_content = (
+            "<WLANProfile>"
+            "<MSM><security><sharedKey>"
+            "<keyMaterial>password123</keyMaterial>"
+            "</sharedKey></security></MSM>"
+            "</WLANProfile>"
+        )
+        assert ProfileXmlParser().parse_xml(xml_content) is None
+
+    def test_missing_key_material_returns_none(self):
+        """测试缺少 keyMaterial 元素时解析失败"""
+        xml_content = "<WLANProfile><name>HomeWifi</name></WLANProfile>"
+        assert ProfileXmlParser().parse_xml(xml_content) is None
+
+    def test_invalid_xml_returns_none(self):
+        """测试非法 XML 返回 None"""
+        assert ProfileXmlParser().parse_xml("<WLANProfile>") is None